@@ -1,16 +1,20 @@
 from langchain_core.runnables import RunnableConfig
-from typing import Optional, List
+from typing import Optional
 from pydantic import BaseModel, Field
 from langgraph.prebuilt import create_react_agent
 from tools_agent.utils.tools import create_rag_tool
 from langchain.chat_models import init_chat_model
 from tools_agent.utils.token import fetch_tokens
-from mcp.client.streamable_http import streamablehttp_client
-from mcp import ClientSession
 from langchain_core.tools import StructuredTool
 from tools_agent.utils.tools import (
     wrap_mcp_authenticate_tool,
     create_langchain_mcp_tool,
+    list_mcp_tools,
+)
+from tools_agent.utils.config import MCPConfig, RagConfig
+from tools_agent.utils.prefetch import (
+    get_prefetched_mcp_tools,
+    get_prefetched_rag_tool,
 )
 
 
@@ -21,31 +25,6 @@ DEFAULT_SYSTEM_PROMPT = (
 )
 
 
-class RagConfig(BaseModel):
-    rag_url: Optional[str] = None
-    """The URL of the rag server"""
-    collections: Optional[List[str]] = None
-    """The collections to use for rag"""
-
-
-class MCPConfig(BaseModel):
-    url: Optional[str] = Field(
-        default=None,
-        optional=True,
-    )
-    """The URL of the MCP server"""
-    tools: Optional[List[str]] = Field(
-        default=None,
-        optional=True,
-    )
-    """The tools to make available to the LLM"""
-    auth_required: Optional[bool] = Field(
-        default=False,
-        optional=True,
-    )
-    """Whether the MCP server requires authentication"""
-
-
 class GraphConfigPydantic(BaseModel):
     model_name: Optional[str] = Field(
         default="openai:gpt-4o",
@@ -148,9 +127,13 @@ async def graph(config: RunnableConfig):
     supabase_token = config.get("configurable", {}).get("x-supabase-access-token")
     if cfg.rag and cfg.rag.rag_url and cfg.rag.collections and supabase_token:
         for collection in cfg.rag.collections:
-            rag_tool = await create_rag_tool(
+            rag_tool = await get_prefetched_rag_tool(
                 cfg.rag.rag_url, collection, supabase_token
             )
+            if rag_tool is None:
+                rag_tool = await create_rag_tool(
+                    cfg.rag.rag_url, collection, supabase_token
+                )
             tools.append(rag_tool)
 
     if cfg.mcp_config and cfg.mcp_config.auth_required:
@@ -176,43 +159,33 @@ async def graph(config: RunnableConfig):
             or None
         )
         try:
-            async with streamablehttp_client(server_url, headers=headers) as streams:
-                read_stream, write_stream, _ = streams
-                async with ClientSession(read_stream, write_stream) as session:
-                    await session.initialize()
-
-                    page_cursor = None
-
-                    while True:
-                        tool_list_page = await session.list_tools(cursor=page_cursor)
-
-                        if not tool_list_page or not tool_list_page.tools:
-                            break
-
-                        for mcp_tool in tool_list_page.tools:
-                            if not tool_names_to_find or (
-                                mcp_tool.name in tool_names_to_find
-                                and mcp_tool.name not in names_of_tools_added
-                            ):
-                                langchain_tool = create_langchain_mcp_tool(
-                                    mcp_tool, mcp_server_url=server_url, headers=headers
-                                )
-                                fetched_mcp_tools_list.append(
-                                    wrap_mcp_authenticate_tool(langchain_tool)
-                                )
-                                if tool_names_to_find:
-                                    names_of_tools_added.add(mcp_tool.name)
-
-                        page_cursor = tool_list_page.nextCursor
-
-                        if not page_cursor:
-                            break
-                        if tool_names_to_find and len(names_of_tools_added) == len(
-                            tool_names_to_find
-                        ):
-                            break
-
-                    tools.extend(fetched_mcp_tools_list)
+            # Reuse the tool list if it was prefetched when the run was created. Only
+            # servers without authentication are prefetched.
+            mcp_tools = None
+            if headers is None:
+                mcp_tools = await get_prefetched_mcp_tools(
+                    server_url, tool_names_to_find
+                )
+            if mcp_tools is None:
+                mcp_tools = await list_mcp_tools(
+                    server_url, headers=headers, tool_names=tool_names_to_find
+                )
+
+            for mcp_tool in mcp_tools:
+                if not tool_names_to_find or (
+                    mcp_tool.name in tool_names_to_find
+                    and mcp_tool.name not in names_of_tools_added
+                ):
+                    langchain_tool = create_langchain_mcp_tool(
+                        mcp_tool, mcp_server_url=server_url, headers=headers
+                    )
+                    fetched_mcp_tools_list.append(
+                        wrap_mcp_authenticate_tool(langchain_tool)
+                    )
+                    if tool_names_to_find:
+                        names_of_tools_added.add(mcp_tool.name)
+
+            tools.extend(fetched_mcp_tools_list)
         except Exception as e:
             print(f"Failed to fetch MCP tools: {e}")
             pass
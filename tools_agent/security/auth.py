@@ -1,9 +1,11 @@
 import os
 import asyncio
+import logging
 from langgraph_sdk import Auth
 from langgraph_sdk.auth.types import StudioUser
 from supabase import create_client, Client
 from typing import Optional, Any
+from tools_agent.utils.prefetch import start_prefetch
 
 supabase_url = os.environ.get("SUPABASE_URL")
 supabase_key = os.environ.get("SUPABASE_KEY")
@@ -80,8 +82,20 @@ async def on_thread_create(
     This handler runs when creating new threads and does two things:
     1. Sets metadata on the thread being created to track ownership
     2. Returns a filter that ensures only the creator can access it
+
+    When prefetching is enabled and the request carries a run config, it also
+    starts the MCP tool and RAG collection lookups in the background so that they
+    overlap with the rest of the request.
     """
 
+    # Only runs carry a config, so this is a no-op for `threads.create`. Prefetching
+    # is an optimization and must never fail the request.
+    try:
+        config = value.get("kwargs", {}).get("config") or {}
+        start_prefetch(config.get("configurable") or {})
+    except Exception as e:
+        logging.error(f"Failed to start prefetch: {e}")
+
     if isinstance(ctx.user, StudioUser):
         return
 
@@ -0,0 +1,27 @@
+from typing import Optional, List
+from pydantic import BaseModel, Field
+
+
+class RagConfig(BaseModel):
+    rag_url: Optional[str] = None
+    """The URL of the rag server"""
+    collections: Optional[List[str]] = None
+    """The collections to use for rag"""
+
+
+class MCPConfig(BaseModel):
+    url: Optional[str] = Field(
+        default=None,
+        optional=True,
+    )
+    """The URL of the MCP server"""
+    tools: Optional[List[str]] = Field(
+        default=None,
+        optional=True,
+    )
+    """The tools to make available to the LLM"""
+    auth_required: Optional[bool] = Field(
+        default=False,
+        optional=True,
+    )
+    """Whether the MCP server requires authentication"""
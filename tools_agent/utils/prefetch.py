@@ -0,0 +1,158 @@
+import os
+import time
+import asyncio
+import logging
+from typing import Any, Callable, Coroutine, Hashable, Optional
+from langchain_core.tools import StructuredTool
+from mcp import Tool
+from tools_agent.utils.config import MCPConfig, RagConfig
+from tools_agent.utils.tools import create_rag_tool, list_mcp_tools
+
+# Prefetching is opt-in. When enabled, the auth handler starts the MCP tool listing
+# and RAG collection lookups as soon as a run is created, and `graph()` awaits those
+# results instead of starting the requests itself.
+PREFETCH_ENABLED = os.environ.get("TOOLS_AGENT_PREFETCH", "").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+DEFAULT_PREFETCH_TTL_SECONDS = 60.0
+
+
+def _get_prefetch_ttl_seconds() -> float:
+    raw_ttl = os.environ.get("TOOLS_AGENT_PREFETCH_TTL")
+    if not raw_ttl:
+        return DEFAULT_PREFETCH_TTL_SECONDS
+    try:
+        return float(raw_ttl)
+    except ValueError:
+        logging.error(
+            f"Invalid TOOLS_AGENT_PREFETCH_TTL {raw_ttl!r}, "
+            f"using {DEFAULT_PREFETCH_TTL_SECONDS} seconds"
+        )
+        return DEFAULT_PREFETCH_TTL_SECONDS
+
+
+# How long a prefetched result waits to be claimed by `graph()` before it is dropped
+PREFETCH_TTL_SECONDS = _get_prefetch_ttl_seconds()
+
+# Each prefetched result is handed to a single `graph()` call, which removes it
+_prefetched: dict[Hashable, tuple[float, asyncio.Task]] = {}
+# Keeps running tasks alive even after their entry has been claimed or dropped
+_running: set[asyncio.Task] = set()
+
+
+def _evict_expired() -> None:
+    now = time.monotonic()
+    for key, (created_at, _) in list(_prefetched.items()):
+        if now - created_at > PREFETCH_TTL_SECONDS:
+            del _prefetched[key]
+
+
+def _on_task_done(key: Hashable, task: asyncio.Task) -> None:
+    """Forget failed prefetches so that the next run can start a new one."""
+    _running.discard(task)
+    # Retrieving the exception also stops it from being reported as never retrieved
+    failed = task.cancelled() or task.exception() is not None or task.result() is None
+    entry = _prefetched.get(key)
+    if failed and entry is not None and entry[1] is task:
+        del _prefetched[key]
+
+
+def _schedule(key: Hashable, start: Callable[[], Coroutine[Any, Any, Any]]) -> None:
+    """Run `start()` in the background unless a result for `key` is already pending."""
+    _evict_expired()
+    if key in _prefetched:
+        return
+
+    task = asyncio.ensure_future(start())
+    _prefetched[key] = (time.monotonic(), task)
+    _running.add(task)
+    task.add_done_callback(lambda t: _on_task_done(key, t))
+
+
+async def _take_prefetched(key: Hashable) -> Any:
+    """Claim the prefetched result for `key`, or return None if there is none to use."""
+    _evict_expired()
+    entry = _prefetched.pop(key, None)
+    if entry is None:
+        return None
+
+    task = entry[1]
+    # Tasks can only be awaited from the event loop that created them
+    if task.get_loop() is not asyncio.get_running_loop() or task.cancelled():
+        return None
+
+    try:
+        return await asyncio.shield(task)
+    except asyncio.CancelledError:
+        # Fall back if the prefetch was cancelled, but not if the caller was
+        if task.cancelled():
+            return None
+        raise
+    except Exception as e:
+        logging.error(f"Prefetch failed: {e}")
+        return None
+
+
+def _mcp_tools_key(server_url: str, tool_names: set[str]) -> Hashable:
+    return ("mcp_tools", server_url, frozenset(tool_names))
+
+
+def _rag_tool_key(rag_url: str, collection_id: str, access_token: str) -> Hashable:
+    return ("rag_tool", rag_url.rstrip("/"), collection_id, access_token)
+
+
+def start_prefetch(configurable: dict[str, Any]) -> None:
+    """Start fetching MCP tools and RAG tools for a run in the background.
+
+    Mirrors the lookups performed in `graph()`, using the same inputs, so that the
+    results can be picked up there with the `get_prefetched_*` helpers. MCP servers
+    that require authentication are skipped: their tokens are stored per user and
+    are only available inside the graph, and exchanging new ones here would issue a
+    token on every run.
+
+    Args:
+        configurable: The `configurable` section of the run's config
+
+    Raises:
+        pydantic.ValidationError: If the RAG or MCP configuration is invalid
+    """
+    if not PREFETCH_ENABLED or not configurable:
+        return
+
+    supabase_token = configurable.get("x-supabase-access-token")
+
+    rag = RagConfig.model_validate(configurable.get("rag") or {})
+    if rag.rag_url and rag.collections and supabase_token:
+        for collection in rag.collections:
+            _schedule(
+                _rag_tool_key(rag.rag_url, collection, supabase_token),
+                lambda collection=collection: create_rag_tool(
+                    rag.rag_url, collection, supabase_token
+                ),
+            )
+
+    mcp_config = MCPConfig.model_validate(configurable.get("mcp_config") or {})
+    if mcp_config.url and mcp_config.tools and not mcp_config.auth_required:
+        server_url = mcp_config.url.rstrip("/") + "/mcp"
+        tool_names = set(mcp_config.tools)
+        _schedule(
+            _mcp_tools_key(server_url, tool_names),
+            lambda: list_mcp_tools(server_url, tool_names=tool_names),
+        )
+
+
+async def get_prefetched_mcp_tools(
+    server_url: str, tool_names: set[str]
+) -> Optional[list[Tool]]:
+    """Return the prefetched MCP tool list, or None if it was not prefetched."""
+    return await _take_prefetched(_mcp_tools_key(server_url, tool_names))
+
+
+async def get_prefetched_rag_tool(
+    rag_url: str, collection_id: str, access_token: str
+) -> Optional[StructuredTool]:
+    """Return the prefetched RAG tool, or None if it was not prefetched."""
+    return await _take_prefetched(_rag_tool_key(rag_url, collection_id, access_token))
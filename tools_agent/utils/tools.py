@@ -27,6 +27,52 @@ def create_langchain_mcp_tool(
     return new_tool
 
 
+async def list_mcp_tools(
+    mcp_server_url: str,
+    headers: dict[str, str] | None = None,
+    tool_names: set[str] | None = None,
+) -> list[Tool]:
+    """List the tools exposed by an MCP server.
+
+    Args:
+        mcp_server_url: The URL of the MCP endpoint
+        headers: Optional headers to send with the request
+        tool_names: If provided, stop paging once all of these tools have been seen
+
+    Returns:
+        The MCP tools returned by the server, in the order they were listed
+    """
+    mcp_tools: list[Tool] = []
+    names_seen = set()
+
+    async with streamablehttp_client(mcp_server_url, headers=headers) as streams:
+        read_stream, write_stream, _ = streams
+        async with ClientSession(read_stream, write_stream) as session:
+            await session.initialize()
+
+            page_cursor = None
+
+            while True:
+                tool_list_page = await session.list_tools(cursor=page_cursor)
+
+                if not tool_list_page or not tool_list_page.tools:
+                    break
+
+                for mcp_tool in tool_list_page.tools:
+                    mcp_tools.append(mcp_tool)
+                    if tool_names and mcp_tool.name in tool_names:
+                        names_seen.add(mcp_tool.name)
+
+                page_cursor = tool_list_page.nextCursor
+
+                if not page_cursor:
+                    break
+                if tool_names and len(names_seen) == len(tool_names):
+                    break
+
+    return mcp_tools
+
+
 def wrap_mcp_authenticate_tool(tool: StructuredTool) -> StructuredTool:
     """Wrap the tool coroutine to handle `interaction_required` MCP error.
 